@@ -1,5 +1,22 @@
+import os
+import csv
+import codecs
+import sys
+import json
+import heapq
+import bisect
+import random
+import multiprocessing
+import tracemalloc
 import tkinter as tk
-from tkinter import ttk, simpledialog
+from tkinter import ttk, simpledialog, filedialog
+from array import array
+from timeit import default_timer as timer
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 DEFAULT_COMPANIES = [
     {
@@ -95,12 +112,394 @@ DEFAULT_COMPANIES = [
     },
 ]
 
+class CompanyLedger:
+    # columnar storage for profit records: names and addresses are interned to ids and the
+    # numeric fields live in typed arrays, so a row costs 19 bytes instead of a dict.
+    # `max_bytes` caps nbytes() (columns with their spare capacity, intern tables and strings);
+    # an append that would go past it is rolled back and raises MemoryError
+    def __init__(self, max_bytes=None):
+        self.max_bytes = max_bytes
+        self.names = []
+        self.name_ids = {}
+        self.addresses = []
+        self.address_ids = {}
+        self.company = array("i")
+        self.address = array("i")
+        self.year = array("h")
+        self.month = array("b")
+        self.profit = array("q")
+        self.string_bytes = 0
+
+    def __len__(self):
+        return len(self.profit)
+
+    def append(self, name, year, profit, month=0, address=""):
+        names_count = len(self.names)
+        addresses_count = len(self.addresses)
+        string_bytes = self.string_bytes
+        self.company.append(self._intern(name, self.names, self.name_ids))
+        self.address.append(self._intern(address, self.addresses, self.address_ids))
+        self.year.append(year)
+        self.month.append(month)
+        self.profit.append(profit)
+        if self.max_bytes is not None and self.nbytes() > self.max_bytes:
+            self._rollback(names_count, addresses_count, string_bytes)
+            raise MemoryError(f"Ledger is over its budget of {self.max_bytes} bytes")
+
+    def append_record(self, company):
+        self.append(company["назва підприємства"], company["рік"], company["прибуток"],
+                    company.get("місяць", 0), company.get("адреса", ""))
+
+    def extend(self, companies):
+        for company in companies:
+            self.append_record(company)
+
+    def record(self, index):
+        return {
+            "назва підприємства": self.names[self.company[index]],
+            "адреса": self.addresses[self.address[index]],
+            "місяць": self.month[index],
+            "рік": self.year[index],
+            "прибуток": self.profit[index],
+        }
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self.record(index)
+
+    def row_size(self):
+        return sum(column.itemsize for column in (self.company, self.address, self.year, self.month, self.profit))
+
+    def nbytes(self):
+        containers = (self.names, self.name_ids, self.addresses, self.address_ids,
+                      self.company, self.address, self.year, self.month, self.profit)
+        return sum(sys.getsizeof(container) for container in containers) + self.string_bytes
+
+    def get_by_profits(self):
+        # same (profits, max_profits) dicts as VisualApp.get_by_profits, keyed by (name, year)
+        if np is not None and len(self):
+            return self._get_by_profits_numpy()
+        profits = {}
+        max_profits = {}
+        # (company, year) packed into one int; years are shifted into 0..65535 to keep keys unique
+        for company_id, year, profit in zip(self.company, self.year, self.profit):
+            key = company_id * 65536 + year + 32768
+            if key in profits:
+                profits[key] += profit
+                if profit > max_profits[key]:
+                    max_profits[key] = profit
+            else:
+                profits[key] = profit
+                max_profits[key] = profit
+        return self._unpack_keys(profits), self._unpack_keys(max_profits)
+
+    def _unpack_keys(self, values):
+        names = self.names
+        result = {}
+        for key, value in values.items():
+            company_id, year = divmod(key, 65536)
+            result[(names[company_id], year - 32768)] = value
+        return result
+
+    def _get_by_profits_numpy(self):
+        # one stable sort on the packed key, then segment sums/maxima with reduceat
+        company = np.frombuffer(self.company, dtype=np.int32).astype(np.int64)
+        year = np.frombuffer(self.year, dtype=np.int16).astype(np.int64)
+        profit = np.frombuffer(self.profit, dtype=np.int64)
+        keys = company * 65536 + year + 32768
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        profit = profit[order]
+        starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+        group_keys = keys[starts].tolist()
+        profits = dict(zip(group_keys, np.add.reduceat(profit, starts).tolist()))
+        max_profits = dict(zip(group_keys, np.maximum.reduceat(profit, starts).tolist()))
+        return self._unpack_keys(profits), self._unpack_keys(max_profits)
+
+    def _intern(self, value, values, ids):
+        value_id = ids.get(value)
+        if value_id is None:
+            value_id = len(values)
+            values.append(value)
+            ids[value] = value_id
+            self.string_bytes += sys.getsizeof(value)
+        return value_id
+
+    def _rollback(self, names_count, addresses_count, string_bytes):
+        # drops the last row and any strings interned for it, then copies every container
+        # so the spare capacity the failed append grew is released as well
+        for column in (self.company, self.address, self.year, self.month, self.profit):
+            column.pop()
+        for values, ids, count in ((self.names, self.name_ids, names_count),
+                                   (self.addresses, self.address_ids, addresses_count)):
+            for value in values[count:]:
+                del ids[value]
+            del values[count:]
+        self.string_bytes = string_bytes
+        for attribute in ("names", "addresses", "company", "address", "year", "month", "profit"):
+            setattr(self, attribute, getattr(self, attribute)[:])
+        self.name_ids = dict(self.name_ids.items())
+        self.address_ids = dict(self.address_ids.items())
+
+class ProfitAggregator:
+    # running (total, max) profit per (company, year); rows can be fed in any number of chunks
+    def __init__(self):
+        self.profits = {}
+        self.max_profits = {}
+        self.rows = 0
+
+    def add(self, name, year, profit):
+        company_key = (name, year)
+        if company_key in self.profits:
+            self.profits[company_key] += profit
+            if profit > self.max_profits[company_key]:
+                self.max_profits[company_key] = profit
+        else:
+            self.profits[company_key] = profit
+            self.max_profits[company_key] = profit
+        self.rows += 1
+
+    def add_chunk(self, companies):
+        profits = self.profits
+        max_profits = self.max_profits
+        count = 0
+        for company in companies:
+            company_key = (company["назва підприємства"], company["рік"])
+            profit = company["прибуток"]
+            if company_key in profits:
+                profits[company_key] += profit
+                if profit > max_profits[company_key]:
+                    max_profits[company_key] = profit
+            else:
+                profits[company_key] = profit
+                max_profits[company_key] = profit
+            count += 1
+        self.rows += count
+
+    def merge(self, other):
+        for company_key, total_profit in other.profits.items():
+            max_profit = other.max_profits[company_key]
+            if company_key in self.profits:
+                self.profits[company_key] += total_profit
+                if max_profit > self.max_profits[company_key]:
+                    self.max_profits[company_key] = max_profit
+            else:
+                self.profits[company_key] = total_profit
+                self.max_profits[company_key] = max_profit
+        self.rows += other.rows
+
+def read_profit_file(path, chunk_size=100000):
+    # yields lists of at most `chunk_size` records from a .csv (header row with the record keys)
+    # or a JSON Lines file; only one chunk is held in memory at a time
+    with open(path, "r", encoding="utf-8-sig", newline="", buffering=1 << 20) as file:
+        if path.lower().endswith(".csv"):
+            rows = (_parse_csv_row(row) for row in csv.DictReader(file))
+        else:
+            rows = (json.loads(line) for line in file if line.strip())
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+def _parse_csv_row(row):
+    row["рік"] = int(row["рік"])
+    row["прибуток"] = int(row["прибуток"])
+    if row.get("місяць"):
+        row["місяць"] = int(row["місяць"])
+    return row
+
+def load_profit_file(path, chunk_size=100000, aggregator=None, progress=None):
+    # streams the file into `aggregator` chunk by chunk; `progress(rows, rows_per_second)` is
+    # called after every chunk. returns the aggregator and the overall rows per second
+    aggregator = aggregator or ProfitAggregator()
+    start_rows = aggregator.rows
+    start_time = timer()
+    for chunk in read_profit_file(path, chunk_size):
+        aggregator.add_chunk(chunk)
+        if progress:
+            rows = aggregator.rows - start_rows
+            progress(rows, rows / max(timer() - start_time, 1e-9))
+    rows_per_second = (aggregator.rows - start_rows) / max(timer() - start_time, 1e-9)
+    return aggregator, rows_per_second
+
+def parallel_load_profit_files(paths, processes=None, split_bytes=64 << 20, chunk_size=100000):
+    # splits every file into byte ranges of about `split_bytes`, aggregates the ranges in a process
+    # pool and merges the partial (sum, max) results. a line belongs to the range it starts in,
+    # so CSV fields must not contain line breaks
+    tasks = []
+    for path in paths:
+        size = os.path.getsize(path)
+        for start in range(0, max(size, 1), split_bytes):
+            tasks.append((path, start, min(start + split_bytes, size), chunk_size))
+    aggregator = ProfitAggregator()
+    start_time = timer()
+    with multiprocessing.Pool(processes) as pool:
+        for partial in pool.imap_unordered(_aggregate_file_range, tasks):
+            aggregator.merge(partial)
+    return aggregator, aggregator.rows / max(timer() - start_time, 1e-9)
+
+def parallel_get_by_profits(companies, processes=None, chunk_size=100000):
+    aggregator = ProfitAggregator()
+    chunks = (companies[start:start + chunk_size] for start in range(0, len(companies), chunk_size))
+    with multiprocessing.Pool(processes) as pool:
+        for partial in pool.imap_unordered(_aggregate_records, chunks):
+            aggregator.merge(partial)
+    return aggregator.profits, aggregator.max_profits
+
+def _aggregate_records(companies):
+    aggregator = ProfitAggregator()
+    aggregator.add_chunk(companies)
+    return aggregator
+
+def _aggregate_file_range(task):
+    # reads its whole range in one call (plus the tail of the line crossing `end`)
+    path, start, end, chunk_size = task
+    aggregator = ProfitAggregator()
+    is_csv = path.lower().endswith(".csv")
+    with open(path, "rb") as file:
+        header = file.readline() if is_csv else b""
+        if start > 0:
+            file.seek(start - 1)
+            file.readline()
+        position = max(file.tell(), len(header))
+        if position >= end:
+            return aggregator
+        file.seek(position)
+        data = file.read(end - position)
+        if not data.endswith(b"\n"):
+            data += file.readline()
+    if position == 0:
+        data = data.removeprefix(codecs.BOM_UTF8)
+    # only "\n" ends a record; splitlines() would also break on U+2028 and friends inside JSON strings
+    lines = data.decode("utf-8").split("\n")
+    if is_csv:
+        fieldnames = next(csv.reader([header.decode("utf-8-sig")]))
+        rows = (_parse_csv_row(row) for row in csv.DictReader(lines, fieldnames=fieldnames))
+    else:
+        rows = (json.loads(line) for line in lines if line.strip())
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            aggregator.add_chunk(chunk)
+            chunk = []
+    aggregator.add_chunk(chunk)
+    return aggregator
+
+class CompanyIndex:
+    # secondary indexes over the record dicts (references only): by year, by company and by
+    # (company, year), plus the sorted years of every company for range queries
+    def __init__(self, companies=()):
+        self.by_year = {}
+        self.by_company = {}
+        self.by_company_year = {}
+        self.company_years = {}
+        for company in companies:
+            self.add(company)
+
+    def add(self, company):
+        name = company["назва підприємства"]
+        year = company["рік"]
+        self.by_year.setdefault(year, []).append(company)
+        self.by_company.setdefault(name, []).append(company)
+        rows = self.by_company_year.get((name, year))
+        if rows is None:
+            rows = self.by_company_year[(name, year)] = []
+            bisect.insort(self.company_years.setdefault(name, []), year)
+        rows.append(company)
+
+    def clear(self):
+        self.by_year = {}
+        self.by_company = {}
+        self.by_company_year = {}
+        self.company_years = {}
+
+    def rows_for_year(self, year):
+        return self.by_year.get(year, [])
+
+    def rows_for_company(self, name, year_from=None, year_to=None):
+        if year_from is None and year_to is None:
+            return self.by_company.get(name, [])
+        years = self.company_years.get(name, [])
+        start = 0 if year_from is None else bisect.bisect_left(years, year_from)
+        stop = len(years) if year_to is None else bisect.bisect_right(years, year_to)
+        rows = []
+        for year in years[start:stop]:
+            rows.extend(self.by_company_year[(name, year)])
+        return rows
+
+class VirtualListView:
+    # shows `height` rows of an arbitrarily long listing in a tk.Text: only the visible rows are
+    # pulled from `rows(start, stop)` and formatted, and the scrollbar maps to a row offset
+    def __init__(self, parent, format_row, height=10, width=50):
+        self.format_row = format_row
+        self.height = height
+        self.offset = 0
+        self.count = lambda: 0
+        self.rows = lambda start, stop: ()
+
+        self.frame = ttk.Frame(parent)
+        self.status_label = ttk.Label(self.frame, text="")
+        self.status_label.pack(side=tk.BOTTOM)
+        self.text = tk.Text(self.frame, height=height, width=width, wrap=tk.NONE)
+        self.text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scrollbar = ttk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self.scroll)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.text.bind(sequence, self.on_mouse_wheel)
+        self.text.bind("<Prior>", lambda event: self.scroll("scroll", -1, "pages") or "break")
+        self.text.bind("<Next>", lambda event: self.scroll("scroll", 1, "pages") or "break")
+
+    def pack(self, **kwargs):
+        self.frame.pack(**kwargs)
+
+    def set_source(self, count, rows):
+        self.count = count
+        self.rows = rows
+        self.refresh()
+
+    def scroll(self, action, amount, unit=None):
+        if action == "moveto":
+            self.offset = int(float(amount) * self.count())
+        elif unit == "pages":
+            self.offset += int(amount) * self.height
+        else:
+            self.offset += int(amount)
+        self.refresh()
+
+    def on_mouse_wheel(self, event):
+        step = -3 if event.num == 4 or getattr(event, "delta", 0) > 0 else 3
+        self.scroll("scroll", step, "units")
+        return "break"
+
+    def refresh(self):
+        total = self.count()
+        self.offset = max(0, min(self.offset, total - self.height))
+        lines = [self.format_row(row) for row in self.rows(self.offset, self.offset + self.height)]
+        self.text.delete(1.0, tk.END)
+        self.text.insert(tk.END, "\n".join(lines))
+        if total:
+            self.scrollbar.set(self.offset / total, (self.offset + len(lines)) / total)
+            self.status_label.config(text=f"Rows {self.offset + 1}-{self.offset + len(lines)} of {total}")
+        else:
+            self.scrollbar.set(0, 1)
+            self.status_label.config(text="No rows")
+
 class VisualApp:
     def __init__(self, root):
         self.root = root
         self.root.title("Visual App")
 
         self.companies = list(DEFAULT_COMPANIES)
+        self.aggregator = ProfitAggregator()
+        self.aggregator.add_chunk(self.companies)
+        self.index = CompanyIndex(self.companies)
+        self.top_25_cache = None
 
         self.create_widgets()
 
@@ -119,9 +518,21 @@ class VisualApp:
         display_top_25_percent_button = ttk.Button(tab1, text="Display Top 25%", command=self.display_top_25_percent)
         display_top_25_percent_button.pack()
 
+        company_profits_button = ttk.Button(tab1, text="Company Profits by Years", command=self.display_company_profits)
+        company_profits_button.pack()
+
+        top_for_year_button = ttk.Button(tab1, text="Top K for Year", command=self.display_top_for_year)
+        top_for_year_button.pack()
+
         self.display_text_companies = tk.Text(tab1, height=10, width=50)
         self.display_text_companies.pack()
 
+        all_companies_label = ttk.Label(tab1, text="All Companies:")
+        all_companies_label.pack()
+
+        self.companies_listing = VirtualListView(tab1, self.format_company, height=10, width=50)
+        self.companies_listing.pack()
+
         tab2 = ttk.Frame(notebook)
         notebook.add(tab2, text="New Companies")
 
@@ -134,18 +545,33 @@ class VisualApp:
         default_companies_button = ttk.Button(tab2, text="Add Default Companies", command=self.add_default_companies)
         default_companies_button.pack()
 
+        load_file_button = ttk.Button(tab2, text="Load Profit File", command=self.load_profit_file)
+        load_file_button.pack()
+
         notebook.pack()
 
     def display_all_companies(self):
-        display_text = "All Companies:\n"
-        for company in self.companies:
-            display_text += f"{company['назва підприємства']}, {company['рік']}, {company['прибуток']}\n"
-        self.display_text_companies.delete(1.0, tk.END)
-        self.display_text_companies.insert(tk.END, display_text)
+        self.companies_listing.set_source(lambda: len(self.companies),
+                                          lambda start, stop: self.companies[start:stop])
+
+    def format_company(self, company):
+        return f"{company['назва підприємства']}, {company['рік']}, {company['прибуток']}"
 
     def display_top_25_percent(self):
-        profits, max_profits = self.get_by_profits(self.companies)
+        # served from the incrementally maintained aggregates and the cached ranking
+        if self.top_25_cache is None:
+            top_25 = self.top_25_percent_of(self.aggregator.profits, self.aggregator.max_profits)
+            self.top_25_cache = (top_25, {(company_info["Company"], company_info["Year"]) for company_info in top_25},
+                                 len(self.aggregator.profits))
+        self.render_top_25_percent(self.top_25_cache[0])
+
+    def display_top_25_percent_of(self, profits, max_profits, header="Top 25% Companies:\n"):
+        self.render_top_25_percent(self.top_25_percent_of(profits, max_profits), header)
+
+    def top_25_percent_of(self, profits, max_profits):
+        return self.find_top_25_percent(self.profits_list(profits, max_profits))
 
+    def profits_list(self, profits, max_profits):
         profits_list = []
 
         for company_key, total_profit in profits.items():
@@ -159,16 +585,51 @@ class VisualApp:
             }
             profits_list.append(company_info)
 
-        self.sort(profits_list)
-        top_25 = self.find_top_25_percent(profits_list)
+        return profits_list
 
-        display_text = "Top 25% Companies:\n"
+    def render_top_25_percent(self, top_25, header="Top 25% Companies:\n"):
+        display_text = header
         for company_info in top_25:
             display_text += f"Company: {company_info['Company']}, Year: {company_info['Year']}, Total Profit: {company_info['Total Profit']}, Maximum Profit: {company_info['Maximum Profit']}\n"
 
         self.display_text_companies.delete(1.0, tk.END)
         self.display_text_companies.insert(tk.END, display_text)
 
+    def track_company(self, company):
+        company_key = (company["назва підприємства"], company["рік"])
+        new_group = company_key not in self.aggregator.profits
+        self.aggregator.add(company_key[0], company_key[1], company["прибуток"])
+        self.index.add(company)
+        self.invalidate_top_25(company_key, new_group)
+
+    def invalidate_top_25(self, company_key, new_group):
+        # the cached ranking survives a change that leaves the number of ranked entries alone
+        # and keeps the changed company-year outside it and strictly below its last entry
+        if self.top_25_cache is None:
+            return
+        top_25, top_keys, groups = self.top_25_cache
+        if new_group:
+            groups += 1
+            if int(groups * 0.25) != len(top_25):
+                self.top_25_cache = None
+                return
+        if company_key in top_keys:
+            self.top_25_cache = None
+            return
+        if top_25:
+            cutoff = (top_25[-1]["Total Profit"], top_25[-1]["Maximum Profit"])
+            if (self.aggregator.profits[company_key], self.aggregator.max_profits[company_key]) >= cutoff:
+                self.top_25_cache = None
+                return
+        self.top_25_cache = (top_25, top_keys, groups)
+
+    def load_profit_file(self):
+        path = filedialog.askopenfilename(filetypes=[("Profit files", "*.csv *.jsonl"), ("All files", "*.*")])
+        if path:
+            aggregator, rows_per_second = load_profit_file(path)
+            header = f"{path}: {aggregator.rows} rows, {rows_per_second:.0f} rows/s\nTop 25% Companies:\n"
+            self.display_top_25_percent_of(aggregator.profits, aggregator.max_profits, header)
+
     def add_new_company(self):
         company_name = simpledialog.askstring("Company Input", "Enter company name:")
         if company_name:
@@ -182,41 +643,191 @@ class VisualApp:
                         "прибуток": profit
                     }
                     self.companies.append(new_company)
+                    self.track_company(new_company)
                     self.display_all_companies()
 
     def clear_all_companies(self):
         self.companies = []
+        self.aggregator = ProfitAggregator()
+        self.index.clear()
+        self.top_25_cache = None
         self.display_all_companies()
 
     def add_default_companies(self):
         default_companies = list(DEFAULT_COMPANIES)
         self.companies.extend(default_companies)
+        for company in default_companies:
+            self.track_company(company)
         self.display_all_companies()
 
-    def get_by_profits(self, companies):
-        max_profits = {}
-        profits = {}
-        for company in companies:
-            company_key = (company["назва підприємства"], company["рік"])
-            if company_key not in max_profits:
-                max_profits[company_key] = company["прибуток"]
-                profits[company_key] = company["прибуток"]
-            else:
-                profits[company_key] += company["прибуток"]
-                if company["прибуток"] > max_profits[company_key]:
-                    max_profits[company_key] = company["прибуток"]
+    @staticmethod
+    def get_by_profits(companies, processes=None):
+        if processes:
+            return parallel_get_by_profits(companies, processes)
+        aggregator = ProfitAggregator()
+        aggregator.add_chunk(companies)
+        return aggregator.profits, aggregator.max_profits
+
+    def company_profits(self, name, year_from=None, year_to=None):
+        return self.get_by_profits(self.index.rows_for_company(name, year_from, year_to))
+
+    def top_for_year(self, year, k):
+        profits, max_profits = self.get_by_profits(self.index.rows_for_year(year))
+        return self.find_top(self.profits_list(profits, max_profits), k=k)
 
-        return profits, max_profits
+    def display_company_profits(self):
+        name = simpledialog.askstring("Company Profits", "Enter company name:")
+        if name:
+            year_from = self.ask_year_bound("From year (empty for all):")
+            year_to = self.ask_year_bound("To year (empty for all):")
+            profits, max_profits = self.company_profits(name, year_from, year_to)
+            display_text = f"Profits of {name}:\n"
+            for (_, year), total_profit in sorted(profits.items(), key=lambda item: item[0][1]):
+                display_text += f"Year: {year}, Total Profit: {total_profit}, Maximum Profit: {max_profits[(name, year)]}\n"
+            self.display_text_companies.delete(1.0, tk.END)
+            self.display_text_companies.insert(tk.END, display_text)
+
+    def ask_year_bound(self, prompt):
+        # askinteger rejects an empty entry, so the bound is read as text; empty or Cancel means no bound
+        message = prompt
+        while True:
+            text = simpledialog.askstring("Company Profits", message)
+            if text is None or not text.strip():
+                return None
+            try:
+                return int(text)
+            except ValueError:
+                message = f"{text.strip()} is not a year. {prompt}"
+
+    def display_top_for_year(self):
+        year = simpledialog.askinteger("Top for Year", "Enter year:")
+        if year:
+            k = simpledialog.askinteger("Top for Year", "How many companies:", initialvalue=10)
+            if k:
+                self.render_top_25_percent(self.top_for_year(year, k), f"Top {k} Companies in {year}:\n")
 
     def find_top_25_percent(self, companies):
-        sorted_companies = sorted(companies, key=lambda x: (x['Total Profit'], x['Maximum Profit']), reverse=True)
-        n = len(sorted_companies)
-        return sorted_companies[:int(n * 0.25)]
+        return self.find_top(companies, percent=25)
+
+    @staticmethod
+    def find_top(companies, k=None, percent=None):
+        # a bounded heap (heapq.nlargest) for small k; past about n/16 the pure-Python heap loses
+        # to one C sort, so large prefixes take a single sorted() slice. both keep the order of
+        # sorted(..., reverse=True)[:k], ties included
+        if k is None:
+            if percent is None:
+                raise ValueError("find_top needs either k or percent")
+            k = int(len(companies) * percent / 100)
+        key = lambda x: (x['Total Profit'], x['Maximum Profit'])
+        if k * 16 <= len(companies):
+            return heapq.nlargest(k, companies, key=key)
+        return sorted(companies, key=key, reverse=True)[:k]
 
     def sort(self, companies):
         companies.sort(key=lambda x: (x['Total Profit'], x['Maximum Profit']), reverse=True)
 
+def make_random_companies(count, companies=1000, years=(2000, 2024)):
+    return [
+        {
+            "назва підприємства": f"Підприємство {random.randrange(companies)}",
+            "адреса": "вул. Головна, 1",
+            "місяць": random.randint(1, 12),
+            "рік": random.randint(*years),
+            "прибуток": random.randrange(100000),
+        }
+        for _ in range(count)
+    ]
+
+def benchmark_ledger(rows=10**6):
+    companies = make_random_companies(rows)
+    print(f"Company ledger: {rows} rows")
+    tracemalloc.start()
+    records = [dict(company) for company in companies]
+    records_memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    start_time = timer()
+    VisualApp.get_by_profits(records)
+    end_time = timer()
+    print(f"  list of dicts: {records_memory / rows:.1f} bytes per row, "
+          f"get_by_profits {((end_time - start_time) * 1000):.1f} milliseconds")
+    del records
+    ledger = CompanyLedger()
+    ledger.extend(companies)
+    start_time = timer()
+    ledger.get_by_profits()
+    end_time = timer()
+    print(f"  CompanyLedger{' (numpy)' if np is not None else ''}: {ledger.nbytes() / rows:.1f} bytes per row, "
+          f"get_by_profits {((end_time - start_time) * 1000):.1f} milliseconds")
+
+def benchmark_top_percent(company_years=10**6, percent=25):
+    profits_list = [
+        {
+            "Company": f"Підприємство {i}",
+            "Year": 2023,
+            "Total Profit": random.randrange(10**6),
+            "Maximum Profit": random.randrange(10**5),
+        }
+        for i in range(company_years)
+    ]
+    print(f"Top {percent}%: {company_years} company-years")
+    companies = list(profits_list)
+    start_time = timer()
+    companies.sort(key=lambda x: (x['Total Profit'], x['Maximum Profit']), reverse=True)
+    expected = sorted(companies, key=lambda x: (x['Total Profit'], x['Maximum Profit']), reverse=True)
+    expected = expected[:int(len(expected) * 0.25)]
+    end_time = timer()
+    print(f"  sort + sorted: {((end_time - start_time) * 1000):.1f} milliseconds")
+    for k in (int(company_years * percent / 100), 100):
+        start_time = timer()
+        top = VisualApp.find_top(profits_list, k=k)
+        end_time = timer()
+        print(f"  find_top k={k}: {((end_time - start_time) * 1000):.1f} milliseconds")
+    print(f"  same top 100: {top == expected[:100]}")
+
+def benchmark_profit_file(rows=10**6, path="profit_benchmark.jsonl"):
+    with open(path, "w", encoding="utf-8") as file:
+        for start in range(0, rows, 100000):
+            file.writelines(json.dumps(company, ensure_ascii=False) + "\n"
+                            for company in make_random_companies(min(100000, rows - start)))
+    print(f"Profit file: {rows} rows")
+    for chunk_size in (1000, 100000):
+        aggregator, rows_per_second = load_profit_file(path, chunk_size)
+        print(f"  chunk {chunk_size}: {rows_per_second:.0f} rows/s, {len(aggregator.profits)} company-years")
+    os.remove(path)
+
+def benchmark_parallel_profit_file(rows=10**6, path="profit_benchmark.jsonl"):
+    with open(path, "w", encoding="utf-8") as file:
+        for start in range(0, rows, 100000):
+            file.writelines(json.dumps(company, ensure_ascii=False) + "\n"
+                            for company in make_random_companies(min(100000, rows - start)))
+    print(f"Parallel profit file: {rows} rows")
+    _, rows_per_second = load_profit_file(path)
+    print(f"  single process: {rows_per_second:.0f} rows/s")
+    split_bytes = os.path.getsize(path) // (4 * (os.cpu_count() or 1)) + 1
+    for processes in sorted({1, 2, 4, os.cpu_count() or 1}):
+        _, rows_per_second = parallel_load_profit_files([path], processes, split_bytes)
+        print(f"  {processes} processes: {rows_per_second:.0f} rows/s")
+    os.remove(path)
+
+BENCHMARKS = {
+    "ledger": benchmark_ledger,
+    "profit_file": benchmark_profit_file,
+    "top_percent": benchmark_top_percent,
+    "parallel_profit_file": benchmark_parallel_profit_file,
+}
+
 if __name__ == "__main__":
-    root = tk.Tk()
-    app = VisualApp(root)
-    root.mainloop()
+    if len(sys.argv) > 1 and sys.argv[1] == "bench":
+        for name in sys.argv[2:] or BENCHMARKS:
+            BENCHMARKS[name]()
+    elif len(sys.argv) > 2 and sys.argv[1] == "load":
+        aggregator, rows_per_second = load_profit_file(
+            sys.argv[2], progress=lambda rows, rate: print(f"{rows} rows, {rate:.0f} rows/s"))
+        print(f"{aggregator.rows} rows, {len(aggregator.profits)} company-years, {rows_per_second:.0f} rows/s")
+    elif len(sys.argv) > 2 and sys.argv[1] == "parallel-load":
+        aggregator, rows_per_second = parallel_load_profit_files(sys.argv[2:])
+        print(f"{aggregator.rows} rows, {len(aggregator.profits)} company-years, {rows_per_second:.0f} rows/s")
+    else:
+        root = tk.Tk()
+        app = VisualApp(root)
+        root.mainloop()
@@ -1,49 +1,282 @@
+import os
+import sys
+import random
+import tracemalloc
 import tkinter as tk
 from tkinter import ttk
+from array import array
+from timeit import default_timer as timer
+
+DELETED = object()
 
 class HashTable:
-    def __init__(self, size=10):
+    # open addressing with linear probing; deleted slots become DELETED tombstones so probe
+    # chains stay intact, and the table doubles or halves to keep the load factor in bounds
+    def __init__(self, size=10, max_load_factor=0.7, min_load_factor=0.2):
         self.size = size
-        self.table = [None] * size
+        self.initial_size = size
+        self.max_load_factor = max_load_factor
+        self.min_load_factor = min_load_factor
+        self._allocate(size)
+        self.count = 0
+        self.tombstones = 0
+        self.resizes = 0
+
+    def __len__(self):
+        return self.count
 
     def hash_function(self, key):
         return hash(key) % self.size
 
     def insert(self, key, value):
-        index = self.hash_function(key)
-        while self.table[index] is not None:
-            if self.table[index][0] == key:
-                self.table[index][1] = value
-                break
-            index = (index + 1) % self.size
-        else:
-            self.table[index] = [key, value]
+        index, free_index = self.probe(key)
+        if index is not None:
+            self.table[index][1] = value
+            return
+        if self.table[free_index] is DELETED:
+            self.tombstones -= 1
+        self.table[free_index] = [key, value]
+        self.count += 1
+        self._grow_if_full()
 
     def delete(self, key):
-        index = self.hash_function(key) % len(self.table)
-        if self.table[index] is not None and self.table[index][0] == key:
-            self.table[index] = None
-        else:
-            del_index = self.search_index(key)
-            self.table[del_index] = None
+        index = self.search_index(key)
+        if index is None:
+            raise KeyError(key)
+        self.table[index] = DELETED
+        self.count -= 1
+        self.tombstones += 1
+        self._shrink_if_sparse()
+
+    def _grow_if_full(self):
+        if self.count + self.tombstones > self.size * self.max_load_factor:
+            # mostly tombstones: rehash in place, otherwise grow
+            self.resize(self.size * 2 if self.count > self.size * self.max_load_factor / 2 else self.size)
+
+    def _shrink_if_sparse(self):
+        if self.size > self.initial_size and self.count < self.size * self.min_load_factor:
+            self.resize(max(self.initial_size, self.size // 2))
+
+    def probe(self, key):
+        # returns (index of key or None, first reusable slot); stops at the first empty slot
+        index = self.hash_function(key)
+        free_index = None
+        while True:
+            bucket = self.table[index]
+            if bucket is None:
+                return None, index if free_index is None else free_index
+            if bucket is DELETED:
+                if free_index is None:
+                    free_index = index
+            elif bucket[0] == key:
+                return index, index
+            index = (index + 1) % self.size
 
     def search_index(self, key):
-        initial_index = self.hash_function(key) % len(self.table)
-        for i in range(len(self.table)):
-            index = (initial_index + i) % len(self.table)
-            if self.table[index][0] == key:
-                return index
+        return self.probe(key)[0]
 
     def search(self, key):
-        return self.table[self.search_index(key)][1]
+        index = self.search_index(key)
+        if index is None:
+            raise KeyError(key)
+        return self.table[index][1]
+
+    def resize(self, size):
+        self.resizes += 1
+        old_table = self.table
+        self.size = size
+        self._allocate(size)
+        self.count = 0
+        self.tombstones = 0
+        for bucket in old_table:
+            if bucket is not None and bucket is not DELETED:
+                self.insert(bucket[0], bucket[1])
+
+    def stats(self):
+        probe_lengths = self._probe_lengths()
+        mean = sum(probe_lengths) / len(probe_lengths) if probe_lengths else 0.0
+        return {
+            "mean_probe_length": mean,
+            "max_probe_length": max(probe_lengths, default=0),
+            "probe_length_variance": (sum((length - mean) ** 2 for length in probe_lengths) / len(probe_lengths)
+                                      if probe_lengths else 0.0),
+            "load_factor": self.count / self.size,
+            "tombstones": self.tombstones,
+            "resizes": self.resizes,
+        }
+
+    def _allocate(self, size):
+        self.table = [None] * size
+
+    def _probe_lengths(self):
+        # probe length of an entry = slots inspected to find it (distance from home slot + 1)
+        return [(i - self.hash_function(bucket[0])) % self.size + 1
+                for i, bucket in enumerate(self.table) if bucket is not None and bucket is not DELETED]
 
     def display(self):
         for i, bucket in enumerate(self.table):
-            if bucket is not None:
+            if bucket is DELETED:
+                print(f"Index {i}: deleted")
+            elif bucket is not None:
                 print(f"Index: {i}, Bucket: {bucket[0]} = {bucket[1]}")
             else:
                 print(f"Index {i}:")
 
+class RobinHoodHashTable(HashTable):
+    # Robin Hood insertion: an entry farther from its home slot takes the place of one closer to
+    # home, which keeps probe lengths even; deletion shifts the following run back instead of
+    # leaving tombstones. buckets are [key, value, hash]
+    def __init__(self, size=10, max_load_factor=0.9, min_load_factor=0.2):
+        super().__init__(size, max_load_factor, min_load_factor)
+
+    def insert(self, key, value):
+        key_hash = hash(key)
+        entry = [key, value, key_hash]
+        index = key_hash % self.size
+        distance = 0
+        while True:
+            bucket = self.table[index]
+            if bucket is None:
+                self.table[index] = entry
+                self.count += 1
+                break
+            if bucket[2] == key_hash and bucket[0] == key:
+                bucket[1] = value
+                return
+            bucket_distance = (index - bucket[2] % self.size) % self.size
+            if bucket_distance < distance:
+                self.table[index], entry = entry, bucket
+                distance = bucket_distance
+            index = (index + 1) % self.size
+            distance += 1
+        self._grow_if_full()
+
+    def search_index(self, key):
+        key_hash = hash(key)
+        index = key_hash % self.size
+        distance = 0
+        while True:
+            bucket = self.table[index]
+            if bucket is None or (index - bucket[2] % self.size) % self.size < distance:
+                return None
+            if bucket[2] == key_hash and bucket[0] == key:
+                return index
+            index = (index + 1) % self.size
+            distance += 1
+
+    def delete(self, key):
+        index = self.search_index(key)
+        if index is None:
+            raise KeyError(key)
+        next_index = (index + 1) % self.size
+        while True:
+            bucket = self.table[next_index]
+            if bucket is None or bucket[2] % self.size == next_index:
+                break
+            self.table[index] = bucket
+            index = next_index
+            next_index = (next_index + 1) % self.size
+        self.table[index] = None
+        self.count -= 1
+        self._shrink_if_sparse()
+
+    def _probe_lengths(self):
+        # the cached hash saves calling hash() again for every entry
+        size = self.size
+        return [(i - bucket[2]) % size + 1 for i, bucket in enumerate(self.table) if bucket is not None]
+
+EMPTY = object()
+
+class CompactHashTable(HashTable):
+    # same probing and tombstones as HashTable, but slots live in parallel arrays: cached hashes
+    # in an array('q'), keys and values in plain lists. a probe compares the cached hash before
+    # the key, and no per-entry [key, value] list is allocated
+    @property
+    def table(self):
+        return [None if key is EMPTY else DELETED if key is DELETED else [key, value]
+                for key, value in zip(self.keys, self.values)]
+
+    def insert(self, key, value):
+        key_hash = hash(key)
+        index, free_index = self._probe(key, key_hash)
+        if index is not None:
+            self.values[index] = value
+            return
+        if self.keys[free_index] is DELETED:
+            self.tombstones -= 1
+        self.hashes[free_index] = key_hash
+        self.keys[free_index] = key
+        self.values[free_index] = value
+        self.count += 1
+        self._grow_if_full()
+
+    def delete(self, key):
+        index = self.search_index(key)
+        if index is None:
+            raise KeyError(key)
+        self.keys[index] = DELETED
+        self.values[index] = None
+        self.count -= 1
+        self.tombstones += 1
+        self._shrink_if_sparse()
+
+    def probe(self, key):
+        return self._probe(key, hash(key))
+
+    def _probe(self, key, key_hash):
+        hashes = self.hashes
+        keys = self.keys
+        size = self.size
+        index = key_hash % size
+        free_index = None
+        while True:
+            slot_key = keys[index]
+            if slot_key is EMPTY:
+                return None, index if free_index is None else free_index
+            if slot_key is DELETED:
+                if free_index is None:
+                    free_index = index
+            elif hashes[index] == key_hash and (slot_key is key or slot_key == key):
+                return index, index
+            index = (index + 1) % size
+
+    def search_index(self, key):
+        return self._probe(key, hash(key))[0]
+
+    def search(self, key):
+        index = self._probe(key, hash(key))[0]
+        if index is None:
+            raise KeyError(key)
+        return self.values[index]
+
+    def resize(self, size):
+        self.resizes += 1
+        old_entries = [(key_hash, key, value) for key_hash, key, value in zip(self.hashes, self.keys, self.values)
+                       if key is not EMPTY and key is not DELETED]
+        self.size = size
+        self._allocate(size)
+        self.tombstones = 0
+        keys = self.keys
+        for key_hash, key, value in old_entries:
+            index = key_hash % size
+            while keys[index] is not EMPTY:
+                index = (index + 1) % size
+            self.hashes[index] = key_hash
+            keys[index] = key
+            self.values[index] = value
+
+    def _allocate(self, size):
+        self.hashes = array("q", bytes(8 * size))
+        self.keys = [EMPTY] * size
+        self.values = [None] * size
+
+    def _probe_lengths(self):
+        # walks the parallel arrays with the cached hashes; going through `table` would build
+        # a [key, value] list per slot
+        size = self.size
+        return [(i - key_hash) % size + 1 for i, (key_hash, key) in enumerate(zip(self.hashes, self.keys))
+                if key is not EMPTY and key is not DELETED]
+
 class HashTableUI:
     def __init__(self, master, hash_table):
         self.master = master
@@ -134,28 +367,119 @@ class HashTableUI:
 
     def display(self):
         self.display_text.delete(1.0, tk.END)
-        output = ""
+        stats = self.hash_table.stats()
+        output = (f"Probe length: mean {stats['mean_probe_length']:.2f}, max {stats['max_probe_length']}; "
+                  f"load factor {stats['load_factor']:.2f}; tombstones {stats['tombstones']}; "
+                  f"resizes {stats['resizes']}\n")
         for i, bucket in enumerate(self.hash_table.table):
-            if bucket is not None:
+            if bucket is DELETED:
+                output += f"Index: {i}, Deleted\n"
+            elif bucket is not None:
                 output += f"Index: {i}, Bucket: {bucket[0]} = {bucket[1]}\n"
             else:
                 output += f"Index: {i}, None\n"
         self.display_text.insert(tk.END, output)
 
-def build_hash_table(file_path):
-    hash_table = HashTable()
+def build_hash_table(file_path, table_class=HashTable):
+    hash_table = table_class()
     with open(file_path, 'r', encoding="utf-8") as file:
         for line in file:
             key, value = line.strip().split(', ')
             hash_table.insert(key, value)
     return hash_table
 
+def bulk_build_hash_table(file_path, table_class=HashTable, chunk_size=8 << 20, progress=None):
+    # estimates the entry count from the file size and the first chunk's average line length,
+    # sizes the table once for that, then parses the file in large binary chunks.
+    # `progress(lines, lines_per_second)` is called after every chunk
+    file_size = os.path.getsize(file_path)
+    start_time = timer()
+    lines = 0
+    hash_table = None
+    with open(file_path, 'rb') as file:
+        tail = b""
+        while True:
+            chunk = file.read(chunk_size)
+            if hash_table is None:
+                sample_lines = chunk.count(b"\n") or 1
+                estimate = file_size * sample_lines // max(len(chunk), 1) + 1
+                hash_table = table_class()
+                size = int(estimate / hash_table.max_load_factor) + 1
+                if size > hash_table.size:
+                    # created at that size rather than resized, so it is not counted in stats()
+                    hash_table = table_class(size=size)
+            if not chunk:
+                break
+            chunk = tail + chunk
+            end = chunk.rfind(b"\n") + 1
+            tail = chunk[end:]
+            lines += _insert_lines(hash_table, chunk[:end])
+            if progress:
+                progress(lines, lines / max(timer() - start_time, 1e-9))
+        lines += _insert_lines(hash_table, tail)
+    return hash_table, lines / max(timer() - start_time, 1e-9)
+
+def _insert_lines(hash_table, data):
+    count = 0
+    insert = hash_table.insert
+    # only "\n" ends a line, as when build_hash_table iterates the file; splitlines() would also
+    # break on U+2028, \x0b, \x1c and friends inside a key. strip() drops a trailing "\r"
+    for line in data.decode("utf-8").split("\n"):
+        line = line.strip()
+        if line:
+            key, value = line.split(', ', 1)
+            insert(key, value)
+            count += 1
+    return count
+
 def main():
-    hash_table = build_hash_table('2.1.txt')
+    hash_table, _ = bulk_build_hash_table('2.1.txt')
 
     root = tk.Tk()
     app = HashTableUI(root, hash_table)
     root.mainloop()
 
+def benchmark_hash_tables(entries=10**5, lookups=10**6):
+    words = ["Гірка", "Холодний", "Зелена", "троянда", "сніг", "трава"]
+    keys = [f"{random.choice(words)} {i}" for i in range(entries)]
+    probes = [random.choice(keys) for _ in range(lookups)]
+    print(f"Hash tables: {entries} string keys, {lookups} lookups")
+    for table_class in (HashTable, RobinHoodHashTable, CompactHashTable):
+        tracemalloc.start()
+        hash_table = table_class()
+        for key in keys:
+            hash_table.insert(key, key)
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        start_time = timer()
+        for key in probes:
+            hash_table.search(key)
+        end_time = timer()
+        print(f"  {table_class.__name__}: {memory / entries:.1f} bytes per entry, "
+              f"{lookups / (end_time - start_time):.0f} lookups/s")
+
+def benchmark_bulk_load(entries=10**6, path="hash_benchmark.txt"):
+    with open(path, "w", encoding="utf-8") as file:
+        file.writelines(f"ключ {i}, значення {i}\n" for i in range(entries))
+    print(f"Hash table load: {entries} lines")
+    start_time = timer()
+    build_hash_table(path)
+    end_time = timer()
+    print(f"  build_hash_table: {entries / (end_time - start_time):.0f} lines/s")
+    for table_class in (HashTable, CompactHashTable):
+        hash_table, lines_per_second = bulk_build_hash_table(path, table_class)
+        print(f"  bulk_build_hash_table, {table_class.__name__}: {lines_per_second:.0f} lines/s, "
+              f"{hash_table.resizes} resizes")
+    os.remove(path)
+
+BENCHMARKS = {
+    "hash_tables": benchmark_hash_tables,
+    "bulk_load": benchmark_bulk_load,
+}
+
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1 and sys.argv[1] == "bench":
+        for name in sys.argv[2:] or BENCHMARKS:
+            BENCHMARKS[name]()
+    else:
+        main()